@@ -208,6 +208,7 @@ class FishAPITTSConfig(I18nMixin):
     reference_id: str = Field(..., alias="reference_id")
     latency: Literal["normal", "balanced"] = Field(..., alias="latency")
     base_url: str = Field(..., alias="base_url")
+    cache_max_size_mb: int = Field(200, alias="cache_max_size_mb")
 
     DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
         "api_key": Description(
@@ -223,6 +224,10 @@ class FishAPITTSConfig(I18nMixin):
         "base_url": Description(
             en="Base URL for Fish TTS API", zh="Fish TTS API 的基础 URL"
         ),
+        "cache_max_size_mb": Description(
+            en="Maximum size of the generated audio cache in MB, 0 to disable",
+            zh="生成音频缓存的最大大小（MB），设为 0 禁用",
+        ),
     }
 
 
@@ -267,6 +272,7 @@ class SherpaOnnxTTSConfig(I18nMixin):
     num_threads: int = Field(1, alias="num_threads")
     speed: float = Field(1.0, alias="speed")
     debug: bool = Field(False, alias="debug")
+    cache_max_size_mb: int = Field(200, alias="cache_max_size_mb")
 
     DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
         "vits_model": Description(en="Path to VITS model file", zh="VITS 模型文件路径"),
@@ -298,6 +304,10 @@ class SherpaOnnxTTSConfig(I18nMixin):
         "num_threads": Description(en="Number of computation threads", zh="计算线程数"),
         "speed": Description(en="Speech speed multiplier", zh="语速倍数"),
         "debug": Description(en="Enable debug mode", zh="启用调试模式"),
+        "cache_max_size_mb": Description(
+            en="Maximum size of the generated audio cache in MB, 0 to disable",
+            zh="生成音频缓存的最大大小（MB），设为 0 禁用",
+        ),
     }
 
 
@@ -420,6 +430,7 @@ class VoicevoxTTSConfig(I18nMixin):
     speed: float = Field(1.0, alias="speed")
     intonation: float = Field(1.0, alias="intonation")
     volume: float = Field(1.0, alias="volume")
+    cache_max_size_mb: int = Field(200, alias="cache_max_size_mb")
 
     DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
         "client_url": Description(
@@ -440,6 +451,10 @@ class VoicevoxTTSConfig(I18nMixin):
         "volume": Description(
             en="Volume adjustment (0.0 to 2.0)", zh="音量调整（0.0 到 2.0）"
         ),
+        "cache_max_size_mb": Description(
+            en="Maximum size of the generated audio cache in MB, 0 to disable",
+            zh="生成音频缓存的最大大小（MB），设为 0 禁用",
+        ),
     }
 
 
@@ -17,6 +17,7 @@ from starlette.staticfiles import StaticFiles as StarletteStaticFiles
 from .routes import init_client_ws_route, init_webtool_routes, init_proxy_route
 from .service_context import ServiceContext
 from .config_manager.utils import Config
+from .tts.tts_cache import TTS_CACHE_DIR
 
 
 # Create a custom StaticFiles class that adds CORS headers
@@ -68,7 +69,7 @@ class WebSocketServer:
 
     Notes:
         - If default_context_cache is omitted, call `await initialize()` to load service context cache.
-        - Use `clean_cache()` to clear and recreate the local cache directory.
+        - Use `clean_cache()` to clear the local cache directory.
     """
 
     def __init__(self, config: Config, default_context_cache: ServiceContext = None):
@@ -88,6 +89,8 @@ class WebSocketServer:
             allow_headers=["*"],
         )
 
+        self.app.add_event_handler("shutdown", self.shutdown)
+
         # Include routes, passing the context instance
         # The context will be populated during the initialize step
         self.app.include_router(
@@ -148,6 +151,12 @@ class WebSocketServer:
             name="frontend",
         )
 
+    async def shutdown(self):
+        """Release resources held by the default service context's engines."""
+        tts_engine = self.default_context_cache.tts_engine
+        if tts_engine and hasattr(tts_engine, "aclose"):
+            await tts_engine.aclose()
+
     async def initialize(self):
         """Asynchronously load the service context from config.
         Calling this function is needed if default_context_cache was not provided to the constructor."""
@@ -155,8 +164,14 @@ class WebSocketServer:
 
     @staticmethod
     def clean_cache():
-        """Clean the cache directory by removing and recreating it."""
+        """Clean the cache directory, keeping the persistent TTS audio cache."""
         cache_dir = "cache"
-        if os.path.exists(cache_dir):
-            shutil.rmtree(cache_dir)
-            os.makedirs(cache_dir)
+        if not os.path.exists(cache_dir):
+            return
+        for entry in os.scandir(cache_dir):
+            if os.path.abspath(entry.path) == os.path.abspath(TTS_CACHE_DIR):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.remove(entry.path)
@@ -50,6 +50,9 @@ class ServiceContext:
         self.live2d_model: Live2dModel = None
         self.asr_engine: ASRInterface = None
         self.tts_engine: TTSInterface = None
+        # Whether tts_engine was created by this context rather than shared
+        # by reference from the default context cache
+        self._owns_tts_engine: bool = False
         self.agent_engine: AgentInterface = None
         # translate_engine can be none if translation is disabled
         self.vad_engine: VADInterface | None = None
@@ -190,6 +193,7 @@ class ServiceContext:
     async def close(self):
         """Clean up resources, especially the MCPClient."""
         logger.info("Closing ServiceContext resources...")
+        await self.close_tts_engine()
         if self.mcp_client:
             logger.info(f"Closing MCPClient for context instance {id(self)}...")
             await self.mcp_client.aclose()
@@ -229,6 +233,7 @@ class ServiceContext:
         self.live2d_model = live2d_model
         self.asr_engine = asr_engine
         self.tts_engine = tts_engine
+        self._owns_tts_engine = False
         self.vad_engine = vad_engine
         self.agent_engine = agent_engine
         self.translate_engine = translate_engine
@@ -272,7 +277,7 @@ class ServiceContext:
         self.init_asr(config.character_config.asr_config)
 
         # init tts from character config
-        self.init_tts(config.character_config.tts_config)
+        await self.init_tts(config.character_config.tts_config)
 
         # init vad from character config
         self.init_vad(config.character_config.vad_config)
@@ -332,18 +337,38 @@ class ServiceContext:
         else:
             logger.info("ASR already initialized with the same config.")
 
-    def init_tts(self, tts_config: TTSConfig) -> None:
+    async def init_tts(self, tts_config: TTSConfig) -> None:
         if not self.tts_engine or (self.character_config.tts_config != tts_config):
             logger.info(f"Initializing TTS: {tts_config.tts_model}")
-            self.tts_engine = TTSFactory.get_tts_engine(
+            tts_engine = TTSFactory.get_tts_engine(
                 tts_config.tts_model,
                 **getattr(tts_config, tts_config.tts_model.lower()).model_dump(),
             )
+            await self.close_tts_engine()
+            self.tts_engine = tts_engine
+            self._owns_tts_engine = True
             # saving config should be done after successful initialization
             self.character_config.tts_config = tts_config
         else:
             logger.info("TTS already initialized with the same config.")
 
+    async def close_tts_engine(self) -> None:
+        """Close the TTS engine if this context created it.
+
+        Engines shared from the default context cache are left open, since
+        other sessions may still be using them.
+        """
+        if (
+            self._owns_tts_engine
+            and self.tts_engine
+            and hasattr(self.tts_engine, "aclose")
+        ):
+            try:
+                await self.tts_engine.aclose()
+            except Exception as e:
+                logger.error(f"Error closing TTS engine: {e}")
+        self._owns_tts_engine = False
+
     def init_vad(self, vad_config: VADConfig) -> None:
         if vad_config.vad_model is None:
             logger.info("VAD is disabled.")
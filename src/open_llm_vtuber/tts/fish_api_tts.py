@@ -2,9 +2,10 @@ from typing import Literal
 from fish_audio_sdk import Session, TTSRequest
 from loguru import logger
 from .tts_interface import TTSInterface
+from .tts_cache import CachedTTSMixin, atomic_write
 
 
-class TTSEngine(TTSInterface):
+class TTSEngine(CachedTTSMixin, TTSInterface):
     """
     Fish TTS that calls the FishTTS API service.
     """
@@ -17,6 +18,7 @@ class TTSEngine(TTSInterface):
         reference_id="7f92f8afb8ec43bf81429cc1c9199cb1",
         latency: Literal["normal", "balanced"] = "balanced",
         base_url="https://api.fish.audio",
+        cache_max_size_mb: int = 200,
     ):
         """
         Initialize the Fish TTS API.
@@ -31,6 +33,8 @@ class TTSEngine(TTSInterface):
 
             base_url (str): The base URL for the Fish TTS API.
 
+            cache_max_size_mb (int): Maximum size of the audio cache in MB, 0 to disable.
+
         """
 
         logger.info(
@@ -39,22 +43,43 @@ class TTSEngine(TTSInterface):
 
         self.reference_id = reference_id
         self.latency = latency
+        self.base_url = base_url
         self.session = Session(apikey=api_key, base_url=base_url)
 
+        self.init_cache(cache_max_size_mb)
+
+    def cache_params(self) -> dict:
+        return {
+            "base_url": self.base_url,
+            "reference_id": self.reference_id,
+            "latency": self.latency,
+            "format": self.file_extension,
+        }
+
     def generate_audio(self, text, file_name_no_ext=None):
-        file_name = self.generate_cache_file_name(file_name_no_ext, self.file_extension)
+        file_name, cached = self.get_cache_file_path(
+            text, file_name_no_ext, self.file_extension
+        )
+        if cached:
+            return file_name
 
         try:
-            with open(file_name, "wb") as f:
-                for chunk in self.session.tts(
-                    TTSRequest(
-                        text=text, reference_id=self.reference_id, latency=self.latency
-                    )
-                ):
-                    f.write(chunk)
+            # Collect the streamed chunks and write them with a single call
+            # instead of issuing one small write per chunk
+            audio = bytearray()
+            for chunk in self.session.tts(
+                TTSRequest(
+                    text=text, reference_id=self.reference_id, latency=self.latency
+                )
+            ):
+                audio.extend(chunk)
+
+            with atomic_write(file_name) as f:
+                f.write(audio)
 
         except Exception as e:
             logger.critical(f"\nError: Fish TTS API fail to generate audio: {e}")
             return None
 
+        self.on_cache_file_written(file_name)
         return file_name
@@ -1,16 +1,22 @@
 import sys
 import os
 
+import numpy as np
 import sherpa_onnx
 import soundfile as sf
 from loguru import logger
 from .tts_interface import TTSInterface
+from .tts_cache import CachedTTSMixin, atomic_write
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(current_dir)
 
+# Loaded models, shared by every engine created with the same model settings
+# so that switching back to a configuration does not load the model again
+_loaded_tts: dict[tuple, sherpa_onnx.OfflineTts] = {}
 
-class TTSEngine(TTSInterface):
+
+class TTSEngine(CachedTTSMixin, TTSInterface):
     def __init__(
         self,
         vits_model,
@@ -25,6 +31,7 @@ class TTSEngine(TTSInterface):
         num_threads=1,
         speed=1.0,
         debug=False,
+        cache_max_size_mb=200,
     ):
         self.vits_model = vits_model
         self.vits_lexicon = vits_lexicon
@@ -47,10 +54,42 @@ class TTSEngine(TTSInterface):
 
         self.tts = self.initialize_tts()
 
+        self.init_cache(cache_max_size_mb)
+
+    def cache_params(self) -> dict:
+        return {
+            "vits_model": self.vits_model,
+            "vits_lexicon": self.vits_lexicon,
+            "vits_tokens": self.vits_tokens,
+            "vits_data_dir": self.vits_data_dir,
+            "vits_dict_dir": self.vits_dict_dir,
+            "tts_rule_fsts": self.tts_rule_fsts,
+            "sid": self.sid,
+            "speed": self.speed,
+            "format": self.file_extension,
+        }
+
     def initialize_tts(self):
         """
-        Initialize the sherpa-onnx TTS engine.
+        Initialize the sherpa-onnx TTS engine, reusing an already loaded model
+        with the same settings.
         """
+        key = (
+            self.vits_model,
+            self.vits_lexicon,
+            self.vits_tokens,
+            self.vits_data_dir,
+            self.vits_dict_dir,
+            self.tts_rule_fsts,
+            self.max_num_sentences,
+            self.provider,
+            self.num_threads,
+            self.debug,
+        )
+        if key in _loaded_tts:
+            logger.info("Reusing loaded sherpa-onnx TTS model")
+            return _loaded_tts[key]
+
         # Construct the configuration for the TTS engine
         tts_config = sherpa_onnx.OfflineTtsConfig(
             model=sherpa_onnx.OfflineTtsModelConfig(
@@ -73,8 +112,10 @@ class TTSEngine(TTSInterface):
         if not tts_config.validate():
             raise ValueError("Please check your sherpa-onnx TTS config")
 
-        # Create and return the sherpa-onnx OfflineTts object
-        return sherpa_onnx.OfflineTts(tts_config)
+        # Create, cache and return the sherpa-onnx OfflineTts object
+        tts = sherpa_onnx.OfflineTts(tts_config)
+        _loaded_tts[key] = tts
+        return tts
 
     def generate_audio(self, text, file_name_no_ext=None):
         """
@@ -87,7 +128,11 @@ class TTSEngine(TTSInterface):
         Returns:
             str: The path to the generated audio file.
         """
-        file_name = self.generate_cache_file_name(file_name_no_ext, self.file_extension)
+        file_name, cached = self.get_cache_file_path(
+            text, file_name_no_ext, self.file_extension
+        )
+        if cached:
+            return file_name
 
         try:
             audio = self.tts.generate(text, sid=self.sid, speed=self.speed)
@@ -98,13 +143,18 @@ class TTSEngine(TTSInterface):
                 )
                 return None
 
-            sf.write(
-                file_name,
-                audio.samples,
-                samplerate=audio.sample_rate,
-                subtype="PCM_16",
-            )
+            # Convert to float32 once; passing the samples as-is makes soundfile
+            # build a float64 copy of the whole utterance before encoding
+            with atomic_write(file_name) as f:
+                sf.write(
+                    f,
+                    np.asarray(audio.samples, dtype=np.float32),
+                    samplerate=audio.sample_rate,
+                    subtype="PCM_16",
+                    format="WAV",
+                )
 
+            self.on_cache_file_written(file_name)
             return file_name
 
         except Exception as e:
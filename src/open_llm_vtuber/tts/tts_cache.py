@@ -0,0 +1,307 @@
+import abc
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from loguru import logger
+
+TTS_CACHE_DIR = os.path.join("cache", "tts")
+# Number of recently used cache entries remembered in memory
+RECENT_CACHE_SIZE = 512
+# Temporary files older than this (in seconds) were left by an interrupted
+# write and are removed by the cache scan
+STALE_TMP_FILE_AGE = 600
+
+# Shared by every engine, since they all store their files in TTS_CACHE_DIR:
+# each sweep has to rank and forget the entries of every engine
+_recent_cache_files: OrderedDict[str, str] = OrderedDict()
+_recent_cache_lock = threading.Lock()
+_cache_sweep_lock = threading.Lock()
+# Running total size of the cache directory in bytes, seeded by one scan
+_cache_size: int | None = None
+_cache_size_lock = threading.Lock()
+
+# mkstemp() creates files readable only by their owner; finished files get the
+# mode a plain open() would have given them
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+_WHITESPACE = re.compile(r"\s+")
+_SPACE_BEFORE_PUNCTUATION = re.compile(r" (?=[,.!?;:、。！？，；：])")
+
+
+def normalize_cache_text(text: str) -> str:
+    """
+    Normalize text for use in a cache key.
+
+    Texts that differ only in Unicode width forms or whitespace, such as
+    "Hello !" and "Hello!", are spoken the same way and share a cache entry.
+
+    Args:
+        text: The text to speak
+
+    Returns:
+        str: The normalized text
+    """
+    text = unicodedata.normalize("NFKC", text)
+    text = _WHITESPACE.sub(" ", text).strip()
+    return _SPACE_BEFORE_PUNCTUATION.sub("", text)
+
+
+@contextmanager
+def atomic_write(file_path: str):
+    """
+    Open a temporary file for binary writing and move it to `file_path` once
+    the block exits without error.
+
+    Readers, including the cache lookup, never see a partially written file,
+    and the temporary file is removed if writing fails.
+
+    Args:
+        file_path: The final path of the file
+    """
+    directory, name = os.path.split(file_path)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory or None, prefix=f"{name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+class CachedTTSMixin(metaclass=abc.ABCMeta):
+    """
+    Persistent on-disk cache for TTS engines.
+
+    Audio files are stored in `cache/tts` and named after a hash of the text and
+    every parameter that affects the synthesized audio, so an identical request
+    is served from disk instead of being synthesized again. The least recently
+    used files are evicted once the cache grows beyond `cache_max_size_mb`.
+    The most recently used entries are also kept in memory. A hit there still
+    checks that the file exists but skips refreshing its access time on disk,
+    so the LRU sweep ranks those entries by their recency in memory instead.
+
+    Engines list this mixin before `TTSInterface`, call `init_cache()` in their
+    constructor and implement `cache_params()`.
+    """
+
+    cache_dir: str = TTS_CACHE_DIR
+    cache_max_size_mb: int = 200
+
+    def init_cache(self, cache_max_size_mb: int = 200) -> None:
+        """
+        Initialize the audio cache.
+
+        Args:
+            cache_max_size_mb: Maximum size of the cache directory in MB.
+                0 or a negative value disables the cache.
+        """
+        global _cache_size
+        self.cache_max_size_mb = cache_max_size_mb or 0
+        if not self.cache_enabled:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with _cache_size_lock:
+            if _cache_size is None:
+                _cache_size = sum(size for _, size, _ in self._scan_cache())
+
+    @property
+    def cache_enabled(self) -> bool:
+        return self.cache_max_size_mb > 0
+
+    @abc.abstractmethod
+    def cache_params(self) -> dict:
+        """
+        Return the engine parameters that affect the synthesized audio.
+
+        Returns:
+            dict: JSON-serializable parameters, e.g. voice, speed and pitch.
+        """
+
+    def _cache_key(self, text: str) -> str:
+        params = {
+            "engine": type(self).__module__.rsplit(".", 1)[-1],
+            "text": normalize_cache_text(text),
+            **self.cache_params(),
+        }
+        params_bytes = json.dumps(
+            params, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+        return hashlib.sha256(params_bytes).digest()[:16].hex()
+
+    def get_cache_file_path(
+        self, text: str, file_name_no_ext=None, file_extension: str = "wav"
+    ) -> tuple[str, bool]:
+        """
+        Get the file path to write the audio of `text` to.
+
+        When the cache is enabled the path is derived from the cache key and
+        `file_name_no_ext` is ignored.
+
+        Args:
+            text: The text to speak
+            file_name_no_ext: Name of the file without extension, used when the
+                cache is disabled
+            file_extension: File extension
+
+        Returns:
+            tuple[str, bool]: The file path, and whether it already holds the
+            audio for `text`.
+        """
+        if not self.cache_enabled:
+            return self.generate_cache_file_name(
+                file_name_no_ext, file_extension
+            ), False
+
+        key = self._cache_key(text)
+        with _recent_cache_lock:
+            file_path = _recent_cache_files.get(key)
+            if file_path is not None:
+                _recent_cache_files.move_to_end(key)
+        if file_path is not None:
+            # The file may have been removed by another process
+            if os.path.isfile(file_path):
+                logger.debug(f"TTS cache hit: {file_path}")
+                return file_path, True
+            with _recent_cache_lock:
+                _recent_cache_files.pop(key, None)
+
+        file_path = os.path.join(self.cache_dir, f"{key}.{file_extension}")
+        try:
+            if os.stat(file_path).st_size > 0:
+                # Refresh the access time so the LRU sweep keeps this file
+                os.utime(file_path)
+                self._remember_cache_file(key, file_path)
+                logger.debug(f"TTS cache hit: {file_path}")
+                return file_path, True
+        except FileNotFoundError:
+            pass
+        return file_path, False
+
+    def _remember_cache_file(self, key: str, file_path: str) -> None:
+        with _recent_cache_lock:
+            _recent_cache_files[key] = file_path
+            _recent_cache_files.move_to_end(key)
+            if len(_recent_cache_files) > RECENT_CACHE_SIZE:
+                _recent_cache_files.popitem(last=False)
+
+    def on_cache_file_written(self, file_path: str) -> None:
+        """
+        Notify the cache that a new audio file has been written.
+
+        Starts a background sweep that evicts the least recently used files once
+        the cache directory exceeds `cache_max_size_mb`.
+        """
+        global _cache_size
+        if not self.cache_enabled or not self._is_cache_file(file_path):
+            return
+        key = os.path.splitext(os.path.basename(file_path))[0]
+        self._remember_cache_file(key, file_path)
+        try:
+            file_size = os.path.getsize(file_path)
+        except OSError:
+            return
+        with _cache_size_lock:
+            _cache_size = (_cache_size or 0) + file_size
+            over_limit = _cache_size > self.cache_max_size_mb * 1024 * 1024
+        if not over_limit or _cache_sweep_lock.locked():
+            return
+        threading.Thread(target=self._evict_cache, daemon=True).start()
+
+    def _scan_cache(self) -> list[tuple[float, int, str]]:
+        """
+        Return (atime, size, path) of every complete file in the cache, removing
+        stale temporary files along the way.
+        """
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+                if entry.name.endswith(".tmp"):
+                    # Skip files still being written by atomic_write(), and
+                    # remove those orphaned by a process killed mid-write
+                    if time.time() - stat.st_mtime > STALE_TMP_FILE_AGE:
+                        try:
+                            os.remove(entry.path)
+                        except OSError:
+                            pass
+                    continue
+                entries.append((stat.st_atime, stat.st_size, entry.path))
+        return entries
+
+    def _evict_cache(self) -> None:
+        global _cache_size
+        if not _cache_sweep_lock.acquire(blocking=False):
+            return
+        try:
+            max_size = self.cache_max_size_mb * 1024 * 1024
+            # Rescan so the running total is corrected for files removed or
+            # replaced outside of this process
+            entries = self._scan_cache()
+            total_size = sum(size for _, size, _ in entries)
+
+            # Hits served from memory do not refresh the access time on disk,
+            # so files remembered in memory are ordered by their recency there
+            # and evicted only after every other file
+            with _recent_cache_lock:
+                recent = {
+                    path: rank for rank, path in enumerate(_recent_cache_files.values())
+                }
+            entries.sort(key=lambda e: (recent.get(e[2], -1), e[0]))
+
+            removed_keys = []
+            for _, size, path in entries:
+                if total_size <= max_size:
+                    break
+                try:
+                    os.remove(path)
+                except OSError as e:
+                    logger.warning(f"Failed to evict TTS cache file {path}: {e}")
+                    continue
+                total_size -= size
+                removed_keys.append(os.path.splitext(os.path.basename(path))[0])
+
+            with _recent_cache_lock:
+                for key in removed_keys:
+                    _recent_cache_files.pop(key, None)
+            with _cache_size_lock:
+                _cache_size = total_size
+            logger.debug(f"Evicted {len(removed_keys)} files from the TTS cache")
+        except Exception as e:
+            logger.error(f"Failed to sweep TTS cache: {e}")
+        finally:
+            _cache_sweep_lock.release()
+
+    def _is_cache_file(self, filepath: str) -> bool:
+        return os.path.dirname(os.path.abspath(filepath)) == os.path.abspath(
+            self.cache_dir
+        )
+
+    def remove_file(self, filepath: str, verbose: bool = True) -> None:
+        """
+        Remove a file from the file system, unless it belongs to the audio cache.
+
+        Parameters:
+            filepath (str): The path to the file to remove.
+            verbose (bool): If True, print messages to the console.
+        """
+        if self.cache_enabled and self._is_cache_file(filepath):
+            return
+        super().remove_file(filepath, verbose)
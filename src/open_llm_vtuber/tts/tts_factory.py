@@ -120,6 +120,7 @@ class TTSFactory:
                 reference_id=kwargs.get("reference_id"),
                 latency=kwargs.get("latency"),
                 base_url=kwargs.get("base_url"),
+                cache_max_size_mb=kwargs.get("cache_max_size_mb", 200),
             )
         elif engine_type == "minimax_tts":
             from .minimax_tts import TTSEngine as MinimaxTTSEngine
@@ -182,6 +183,7 @@ class TTSFactory:
                 speed=kwargs.get("speed"),
                 intonation=kwargs.get("intonation"),
                 volume=kwargs.get("volume"),
+                cache_max_size_mb=kwargs.get("cache_max_size_mb", 200),
             )
         else:
             raise ValueError(f"Unknown TTS engine type: {engine_type}")
@@ -1,10 +1,33 @@
-import os
+import asyncio
+import atexit
+import threading
+from pathlib import Path
+
 import httpx
 from loguru import logger
 from .tts_interface import TTSInterface
+from .tts_cache import CachedTTSMixin, atomic_write
+
+Path("cache").mkdir(parents=True, exist_ok=True)
+
+# Shared by synchronous callers so connections are reused across utterances
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
 
+def _get_client() -> httpx.Client:
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(
+                timeout=30,
+                limits=httpx.Limits(max_keepalive_connections=16, keepalive_expiry=120),
+            )
+            atexit.register(_client.close)
+        return _client
 
-class TTSEngine(TTSInterface):
+
+class TTSEngine(CachedTTSMixin, TTSInterface):
     def __init__(
         self,
         client_url: str = "http://127.0.0.1:50021",
@@ -13,10 +36,11 @@ class TTSEngine(TTSInterface):
         speed: float = 1.0,
         intonation: float = 1.0,
         volume: float = 1.0,
+        cache_max_size_mb: int = 200,
     ):
         """
         Initialize Voicevox TTS engine.
-        
+
         Args:
             client_url: URL of the Voicevox server
             voicevox_speaker_id: Speaker ID
@@ -24,6 +48,7 @@ class TTSEngine(TTSInterface):
             speed: Speed adjustment (0.5 to 2.0)
             intonation: Intonation adjustment (0.0 to 2.0)
             volume: Volume adjustment (0.0 to 2.0)
+            cache_max_size_mb: Maximum size of the audio cache in MB, 0 to disable
         """
         self.client_url = client_url
         self.voicevox_speaker_id = voicevox_speaker_id
@@ -31,67 +56,180 @@ class TTSEngine(TTSInterface):
         self.speed = speed
         self.intonation = intonation
         self.volume = volume
-        
+
         self.file_extension = "wav"
-        self.new_audio_dir = "cache"
-        
-        if not os.path.exists(self.new_audio_dir):
-            os.makedirs(self.new_audio_dir)
-    
+
+        # Built once and reused for every utterance: the speaker parameter sent
+        # with both requests, and the fields overridden in each audio query
+        self._speaker_params = {"speaker": self.voicevox_speaker_id}
+        self._audio_query_overrides = {
+            "speedScale": self.speed,
+            "pitchScale": self.pitch,
+            "intonationScale": self.intonation,
+            "volumeScale": self.volume,
+        }
+
+        self.init_cache(cache_max_size_mb)
+
+        # Created lazily so that it is bound to the event loop serving requests
+        self._async_client: httpx.AsyncClient | None = None
+        self._async_client_lock = asyncio.Lock()
+
+        # Warm up the speaker in the background so the first utterance does not
+        # pay for the server loading the voice model
+        threading.Thread(target=self._initialize_speaker, daemon=True).start()
+
+    def cache_params(self) -> dict:
+        return {
+            "client_url": self.client_url,
+            "speaker": self.voicevox_speaker_id,
+            "pitch": self.pitch,
+            "speed": self.speed,
+            "intonation": self.intonation,
+            "volume": self.volume,
+            "format": self.file_extension,
+        }
+
+    def _initialize_speaker(self) -> None:
+        try:
+            client = _get_client()
+            response = client.post(
+                f"{self.client_url}/initialize_speaker",
+                params={"speaker": self.voicevox_speaker_id, "skip_reinit": True},
+                timeout=60,
+            )
+            response.raise_for_status()
+            logger.debug(f"Voicevox speaker {self.voicevox_speaker_id} initialized")
+        except Exception as e:
+            logger.warning(f"Failed to initialize Voicevox speaker: {e}")
+
+    def _adjust_audio_query(self, audio_query: dict) -> None:
+        audio_query.update(self._audio_query_overrides)
+
+    async def _get_async_client(self) -> httpx.AsyncClient:
+        async with self._async_client_lock:
+            if self._async_client is None or self._async_client.is_closed:
+                self._async_client = httpx.AsyncClient(
+                    base_url=self.client_url,
+                    timeout=30,
+                    limits=httpx.Limits(max_keepalive_connections=8),
+                )
+            return self._async_client
+
+    async def aclose(self) -> None:
+        """Close the HTTP client shared by async requests."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    def _save_audio_file(self, file_name: str, audio: bytes) -> None:
+        with atomic_write(file_name) as f:
+            f.write(audio)
+        self.on_cache_file_written(file_name)
+
+    async def async_generate_audio(self, text: str, file_name_no_ext=None) -> str:
+        """
+        Generate speech audio file using Voicevox TTS without blocking the event loop.
+
+        Both requests go through one persistent client, so /synthesis reuses the
+        keep-alive connection of /audio_query. The cache lookup and the file
+        write run in a worker thread so they do not block the event loop.
+
+        Args:
+            text: The text to speak
+            file_name_no_ext: Name of the file without extension
+
+        Returns:
+            str: The path to the generated audio file
+        """
+        file_name, cached = await asyncio.to_thread(
+            self.get_cache_file_path, text, file_name_no_ext, self.file_extension
+        )
+        if cached:
+            return file_name
+
+        try:
+            client = await self._get_async_client()
+
+            response = await client.post(
+                "/audio_query",
+                params={"text": text, **self._speaker_params},
+            )
+            response.raise_for_status()
+            audio_query = response.json()
+            self._adjust_audio_query(audio_query)
+
+            async with client.stream(
+                "POST",
+                "/synthesis",
+                params=self._speaker_params,
+                json=audio_query,
+            ) as response:
+                response.raise_for_status()
+                audio = bytearray()
+                async for chunk in response.aiter_bytes(65536):
+                    audio.extend(chunk)
+
+            await asyncio.to_thread(self._save_audio_file, file_name, audio)
+            logger.info(f"Generated audio file: {file_name}")
+            return file_name
+
+        except Exception as e:
+            logger.error(f"Error generating audio with Voicevox: {e}")
+            return None
+
     def generate_audio(self, text: str, file_name_no_ext=None) -> str:
         """
         Generate speech audio file using Voicevox TTS.
-        
+
         Args:
             text: The text to speak
             file_name_no_ext: Name of the file without extension
-        
+
         Returns:
             str: The path to the generated audio file
         """
-        file_name = self.generate_cache_file_name(file_name_no_ext, self.file_extension)
-        
+        file_name, cached = self.get_cache_file_path(
+            text, file_name_no_ext, self.file_extension
+        )
+        if cached:
+            return file_name
+
         try:
             # First, get the audio query
             query_url = f"{self.client_url}/audio_query"
-            query_params = {
-                "text": text,
-                "speaker": self.voicevox_speaker_id,
-            }
-            
-            with httpx.Client() as client:
-                # Get audio query
-                response = client.post(query_url, params=query_params)
-                response.raise_for_status()
-                audio_query = response.json()
-            
-            # Adjust parameters
-            audio_query["speedScale"] = self.speed
-            audio_query["pitchScale"] = self.pitch
-            audio_query["intonationScale"] = self.intonation
-            audio_query["volumeScale"] = self.volume
-            
+            query_params = {"text": text, **self._speaker_params}
+
+            # The shared client keeps the connection alive across both requests
+            # and across utterances
+            client = _get_client()
+            # Get audio query
+            response = client.post(query_url, params=query_params)
+            response.raise_for_status()
+            audio_query = response.json()
+
+            self._adjust_audio_query(audio_query)
+
             # Generate audio
             synthesis_url = f"{self.client_url}/synthesis"
-            synthesis_params = {
-                "speaker": self.voicevox_speaker_id,
-            }
-            
-            with httpx.Client() as client:
-                response = client.post(
-                    synthesis_url,
-                    params=synthesis_params,
-                    json=audio_query,
-                )
+
+            with client.stream(
+                "POST",
+                synthesis_url,
+                params=self._speaker_params,
+                json=audio_query,
+            ) as response:
                 response.raise_for_status()
-                
-                # Save audio file
-                with open(file_name, "wb") as f:
-                    f.write(response.content)
-            
+
+                # Save audio file as it is received
+                with atomic_write(file_name) as f:
+                    for chunk in response.iter_bytes(65536):
+                        f.write(chunk)
+
             logger.info(f"Generated audio file: {file_name}")
+            self.on_cache_file_written(file_name)
             return file_name
-            
+
         except Exception as e:
             logger.error(f"Error generating audio with Voicevox: {e}")
             return None
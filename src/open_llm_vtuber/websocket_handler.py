@@ -299,7 +299,7 @@ class WebSocketHandler:
 
         # Clean up other client data
         self.client_connections.pop(client_uid, None)
-        self.client_contexts.pop(client_uid, None)
+        session_context = self.client_contexts.pop(client_uid, None)
         self.received_data_buffers.pop(client_uid, None)
         if client_uid in self.current_conversation_tasks:
             task = self.current_conversation_tasks[client_uid]
@@ -307,6 +307,10 @@ class WebSocketHandler:
                 task.cancel()
             self.current_conversation_tasks.pop(client_uid, None)
 
+        # Close the TTS engine if the session created its own
+        if session_context:
+            await session_context.close_tts_engine()
+
         # Call context close to clean up resources (e.g., MCPClient)
         context = self.client_contexts.get(client_uid)
         if context: